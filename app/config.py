@@ -17,4 +17,14 @@ UPLOAD_DIR = Path(os.getenv("UPLOAD_DIR", _default_upload_dir))
 
 UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
 
+# Rendered QR images, kept next to the uploads so they survive restarts.
+QR_CACHE_DIR = Path(os.getenv("QR_CACHE_DIR", str(UPLOAD_DIR.parent / "qr_cache")))
+QR_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+# Compiled template bytecode, so a cold-started machine skips parsing templates.
+JINJA_CACHE_DIR = Path(os.getenv("JINJA_CACHE_DIR", str(UPLOAD_DIR.parent / "jinja_cache")))
+JINJA_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+# Re-check template files for changes on every render; turned off in fly.toml.
+TEMPLATES_AUTO_RELOAD = os.getenv("TEMPLATES_AUTO_RELOAD", "1") == "1"
+
 GOOGLE_CLOUD_API_KEY = os.getenv("GOOGLE_CLOUD_API_KEY", "")
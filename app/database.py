@@ -1,13 +1,35 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
 
 from app.config import DATABASE_URL
 
 connect_args = {}
+pool_args = {}
 if DATABASE_URL.startswith("sqlite"):
+    # One writer at a time, so the default pool is plenty. In-memory URLs get
+    # SingletonThreadPool, which rejects the sizing arguments anyway.
     connect_args["check_same_thread"] = False
+else:
+    # Sized for FastAPI's threadpool (40 threads) so sync handlers don't queue
+    # on the default 5 + 10 connections. Network databases can also drop idle
+    # connections; SQLite files can't.
+    pool_args.update(
+        pool_size=20, max_overflow=10, pool_timeout=30, pool_pre_ping=True, pool_recycle=3600
+    )
 
-engine = create_engine(DATABASE_URL, connect_args=connect_args)
+engine = create_engine(DATABASE_URL, connect_args=connect_args, **pool_args)
+
+if DATABASE_URL.startswith("sqlite"):
+    @event.listens_for(engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        # WAL lets page reads proceed while a write is in progress.
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA cache_size=-20000")  # ~20 MB
+        cursor.execute("PRAGMA mmap_size=268435456")  # 256 MB
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.close()
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
@@ -0,0 +1,45 @@
+"""Cached option lists for the storage location and tag dropdowns.
+
+Both tables change rarely, so their (id, name) rows are kept in process for
+DROPDOWN_TTL seconds instead of being queried on every form render. Rows are
+plain tuples rather than ORM objects so they can outlive the session.
+"""
+import time
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models import StorageLocation, Tag
+
+DROPDOWN_TTL = 300  # seconds
+
+
+class _TTLCached:
+    """Reuse a query function's result for DROPDOWN_TTL seconds."""
+
+    def __init__(self, fetch):
+        self._fetch = fetch
+        self._fetched_at = 0.0
+        self._rows = None
+
+    def __call__(self, db: Session):
+        now = time.monotonic()
+        if self._rows is None or now - self._fetched_at >= DROPDOWN_TTL:
+            self._rows = self._fetch(db)
+            self._fetched_at = now
+        return self._rows
+
+    def cache_clear(self) -> None:
+        self._rows = None
+
+
+@_TTLCached
+def get_locations(db: Session):
+    return db.execute(
+        select(StorageLocation.id, StorageLocation.name).order_by(StorageLocation.name)
+    ).all()
+
+
+@_TTLCached
+def get_all_tags(db: Session):
+    return db.execute(select(Tag.id, Tag.name).order_by(Tag.name)).all()
@@ -1,27 +1,77 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.staticfiles import StaticFiles
+from starlette.middleware.gzip import GZipMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 
 from app.config import BASE_DIR, SECRET_KEY, UPLOAD_DIR
-from app.database import Base, engine, SessionLocal
-from app.seed import seed_locations, seed_tags
+
+
+class CachedStaticFiles(StaticFiles):
+    """StaticFiles that adds a Cache-Control header to successful responses."""
+
+    def __init__(self, *args, cache_control: str, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_control = cache_control
+
+    async def get_response(self, path, scope):
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 304):
+            response.headers["Cache-Control"] = self.cache_control
+        return response
+
+
+# WebP uploads and PNG QR codes are already compressed; gzipping them only burns CPU.
+_PRECOMPRESSED_PREFIXES = ("/uploads/",)
+_PRECOMPRESSED_SUFFIXES = (".png", ".webp")
+
+
+class TextGZipMiddleware:
+    """Gzip responses except for already-compressed images, picked by path."""
+
+    def __init__(self, app, **gzip_options):
+        self.app = app
+        self.gzip_app = GZipMiddleware(app, **gzip_options)
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "http":
+            path = scope["path"]
+            if not (path.startswith(_PRECOMPRESSED_PREFIXES) or path.endswith(_PRECOMPRESSED_SUFFIXES)):
+                await self.gzip_app(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
 
 app = FastAPI(title="QR Food Storage")
 app.add_middleware(SessionMiddleware, secret_key=SECRET_KEY)
 
-app.mount("/static", StaticFiles(directory=str(BASE_DIR / "app" / "static")), name="static")
-app.mount("/uploads", StaticFiles(directory=str(UPLOAD_DIR)), name="uploads")
 
+@app.middleware("http")
+async def html_no_cache(request: Request, call_next):
+    # Pages are rendered per request; let browsers keep them but revalidate.
+    response = await call_next(request)
+    if response.headers.get("content-type", "").startswith("text/html"):
+        response.headers.setdefault("Cache-Control", "no-cache")
+    return response
+
+
+# Added last so it wraps everything, including the static CSS.
+app.add_middleware(TextGZipMiddleware, minimum_size=500, compresslevel=6)
+
+# /static isn't versioned, so a day rather than forever.
+app.mount(
+    "/static",
+    CachedStaticFiles(directory=str(BASE_DIR / "app" / "static"), cache_control="public, max-age=86400"),
+    name="static",
+)
+# Uploaded photos get a fresh random name per upload and are never rewritten.
+app.mount(
+    "/uploads",
+    CachedStaticFiles(directory=str(UPLOAD_DIR), cache_control="public, max-age=31536000, immutable"),
+    name="uploads",
+)
 
-@app.on_event("startup")
-def on_startup():
-    Base.metadata.create_all(bind=engine)
-    db = SessionLocal()
-    try:
-        seed_locations(db)
-        seed_tags(db)
-    finally:
-        db.close()
+# Schema creation and seeding run once per deploy via `python -m app.seed`,
+# not on every worker start.
 
 
 # Register route modules
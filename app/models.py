@@ -4,7 +4,7 @@ import secrets
 from datetime import date, datetime, timezone
 from typing import List, Optional
 
-from sqlalchemy import Boolean, Column, Date, DateTime, Float, ForeignKey, Integer, String, Table, Text, UniqueConstraint
+from sqlalchemy import DDL, Boolean, Column, Date, DateTime, Float, ForeignKey, Index, Integer, String, Table, Text, UniqueConstraint, column, event, table, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -34,21 +34,38 @@ class FoodItem(Base):
         String(16), unique=True, index=True, default=_generate_public_id
     )
     created_at: Mapped[datetime] = mapped_column(DateTime, default=_utcnow)
+    # Denormalized from the newest revision; set whenever a revision is added.
+    current_revision_id: Mapped[Optional[int]] = mapped_column(
+        ForeignKey("item_revisions.id", use_alter=True), nullable=True, index=True
+    )
+    is_current_deleted: Mapped[bool] = mapped_column(Boolean, default=False)
 
+    # Relationships raise instead of lazy-loading; queries must declare
+    # what they need with selectinload()/joinedload().
     revisions: Mapped[List[ItemRevision]] = relationship(
-        back_populates="item", order_by="ItemRevision.revision_num"
+        back_populates="item",
+        order_by="ItemRevision.revision_num",
+        foreign_keys="ItemRevision.item_id",
+        lazy="raise_on_sql",
+    )
+    tags: Mapped[List[Tag]] = relationship(
+        secondary=item_tags, back_populates="items", lazy="raise_on_sql"
     )
-    tags: Mapped[List[Tag]] = relationship(secondary=item_tags, back_populates="items")
     entries: Mapped[List[InventoryEntry]] = relationship(
-        back_populates="item", order_by="InventoryEntry.expiration_date"
+        back_populates="item", order_by="InventoryEntry.expiration_date", lazy="raise_on_sql"
+    )
+    latest_revision: Mapped[Optional[ItemRevision]] = relationship(
+        primaryjoin="FoodItem.current_revision_id == ItemRevision.id",
+        foreign_keys=[current_revision_id],
+        viewonly=True,
+        lazy="joined",
     )
-
-    @property
-    def latest_revision(self) -> Optional[ItemRevision]:
-        return self.revisions[-1] if self.revisions else None
 
     @property
     def latest_active_revision(self) -> Optional[ItemRevision]:
+        if not self.is_current_deleted:
+            return self.latest_revision
+        # Only deleted items need the history (requires revisions to be loaded).
         for rev in reversed(self.revisions):
             if not rev.is_deleted:
                 return rev
@@ -56,8 +73,7 @@ class FoodItem(Base):
 
     @property
     def is_deleted(self) -> bool:
-        latest = self.latest_revision
-        return latest.is_deleted if latest else False
+        return self.is_current_deleted
 
     @property
     def active_entries(self) -> List[InventoryEntry]:
@@ -71,9 +87,14 @@ class FoodItem(Base):
 
 class ItemRevision(Base):
     __tablename__ = "item_revisions"
+    __table_args__ = (
+        Index("ix_revisions_item_revnum", "item_id", "revision_num"),
+        Index("ix_revisions_loc_deleted", "storage_location_id", "is_deleted"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    item_id: Mapped[int] = mapped_column(ForeignKey("food_items.id"), index=True)
+    # Indexed by ix_revisions_item_revnum, which leads with item_id.
+    item_id: Mapped[int] = mapped_column(ForeignKey("food_items.id"))
     revision_num: Mapped[int] = mapped_column(Integer)
     name: Mapped[str] = mapped_column(String(255))
     date_prepared: Mapped[date] = mapped_column(Date)
@@ -88,11 +109,36 @@ class ItemRevision(Base):
     is_deleted: Mapped[bool] = mapped_column(Boolean, default=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=_utcnow)
 
-    item: Mapped[FoodItem] = relationship(back_populates="revisions")
+    item: Mapped[FoodItem] = relationship(
+        back_populates="revisions", foreign_keys=[item_id], lazy="raise_on_sql"
+    )
     links: Mapped[List[RevisionLink]] = relationship(
-        back_populates="revision", cascade="all, delete-orphan"
+        back_populates="revision", cascade="all, delete-orphan", lazy="raise_on_sql"
     )
-    storage_location: Mapped[StorageLocation] = relationship()
+    storage_location: Mapped[StorageLocation] = relationship(lazy="raise_on_sql")
+
+
+# Trigram full-text index over revision names (SQLite only), kept in sync with
+# item_revisions by triggers. Not part of the metadata; created alongside it.
+item_revisions_fts = table("item_revisions_fts", column("rowid"), column("name"))
+
+_FTS_DDL = [
+    """CREATE VIRTUAL TABLE IF NOT EXISTS item_revisions_fts USING fts5(
+        name, content='item_revisions', content_rowid='id', tokenize='trigram'
+    )""",
+    """CREATE TRIGGER IF NOT EXISTS item_revisions_fts_ai AFTER INSERT ON item_revisions BEGIN
+        INSERT INTO item_revisions_fts(rowid, name) VALUES (new.id, new.name);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS item_revisions_fts_ad AFTER DELETE ON item_revisions BEGIN
+        INSERT INTO item_revisions_fts(item_revisions_fts, rowid, name) VALUES ('delete', old.id, old.name);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS item_revisions_fts_au AFTER UPDATE OF name ON item_revisions BEGIN
+        INSERT INTO item_revisions_fts(item_revisions_fts, rowid, name) VALUES ('delete', old.id, old.name);
+        INSERT INTO item_revisions_fts(rowid, name) VALUES (new.id, new.name);
+    END""",
+]
+for _stmt in _FTS_DDL:
+    event.listen(ItemRevision.__table__, "after_create", DDL(_stmt).execute_if(dialect="sqlite"))
 
 
 class RevisionLink(Base):
@@ -105,7 +151,7 @@ class RevisionLink(Base):
     url: Mapped[str] = mapped_column(Text)
     label: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
 
-    revision: Mapped[ItemRevision] = relationship(back_populates="links")
+    revision: Mapped[ItemRevision] = relationship(back_populates="links", lazy="raise_on_sql")
 
 
 class Tag(Base):
@@ -116,11 +162,23 @@ class Tag(Base):
     is_default: Mapped[bool] = mapped_column(Boolean, default=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=_utcnow)
 
-    items: Mapped[List[FoodItem]] = relationship(secondary=item_tags, back_populates="tags")
+    items: Mapped[List[FoodItem]] = relationship(
+        secondary=item_tags, back_populates="tags", lazy="raise_on_sql"
+    )
 
 
 class InventoryEntry(Base):
     __tablename__ = "inventory_entries"
+    __table_args__ = (
+        # Partial index over active entries only: backs the list page's
+        # per-item count / earliest-expiry aggregate.
+        Index(
+            "ix_entries_active_item_exp",
+            "item_id",
+            "expiration_date",
+            sqlite_where=text("is_consumed = 0"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     item_id: Mapped[int] = mapped_column(ForeignKey("food_items.id"), index=True)
@@ -132,7 +190,7 @@ class InventoryEntry(Base):
     created_at: Mapped[datetime] = mapped_column(DateTime, default=_utcnow)
     consumed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
 
-    item: Mapped[FoodItem] = relationship(back_populates="entries")
+    item: Mapped[FoodItem] = relationship(back_populates="entries", lazy="raise_on_sql")
 
 
 class StorageLocation(Base):
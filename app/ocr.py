@@ -5,7 +5,6 @@ import re
 from typing import Optional
 
 import requests
-from PIL import Image
 
 from app.config import GOOGLE_CLOUD_API_KEY, UPLOAD_DIR
 
@@ -26,6 +25,8 @@ NOISE_PATTERNS = [
 
 def _resize_image_bytes(filepath: str) -> bytes:
     """Read image from disk, resize to max dimension, return JPEG bytes."""
+    from PIL import Image
+
     img = Image.open(filepath)
     img.thumbnail((MAX_DIMENSION, MAX_DIMENSION))
     if img.mode in ("RGBA", "P"):
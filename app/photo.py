@@ -1,7 +1,8 @@
 """Photo storage abstraction. Swap this module to use cloud storage later."""
-import uuid
+import os
+import secrets
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 from fastapi import UploadFile
 
@@ -9,25 +10,97 @@ from app.config import UPLOAD_DIR
 
 ALLOWED_EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp"}
 MAX_SIZE_BYTES = 10 * 1024 * 1024  # 10 MB
+CHUNK_SIZE = 64 * 1024  # 64 KiB
 
+# Stored photos are downscaled and re-encoded as WebP.
+MAX_DIMENSION = 1280
+WEBP_QUALITY = 82
+
+
+def stage_photo(file: UploadFile) -> Tuple[Path, str]:
+    """Write an upload to a staging file and check it is an image.
+
+    Returns (staged_path, filename); the photo is served under filename once
+    finalize_photo() has run. Does blocking file I/O; call it from a sync
+    handler.
+    """
+    from PIL import Image
 
-async def save_photo(file: UploadFile) -> str:
-    """Save an uploaded photo and return the filename."""
     ext = Path(file.filename).suffix.lower() if file.filename else ".jpg"
     if ext not in ALLOWED_EXTENSIONS:
         raise ValueError(f"File type {ext} not allowed. Use: {ALLOWED_EXTENSIONS}")
 
-    filename = f"{uuid.uuid4().hex}{ext}"
+    token = secrets.token_hex(16)
+    staged = UPLOAD_DIR / f"{token}.upload"
+
+    try:
+        # Stream to disk so a large upload is never held in memory all at once.
+        size = 0
+        with staged.open("wb") as fh:
+            while True:
+                chunk = file.file.read(CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > MAX_SIZE_BYTES:
+                    raise ValueError("File too large (max 10 MB)")
+                fh.write(chunk)
+
+        # Image.open only parses the header; decoding happens in finalize_photo.
+        try:
+            Image.open(staged).close()
+        except (OSError, Image.DecompressionBombError) as e:
+            raise ValueError("Could not read image file") from e
+    except ValueError:
+        staged.unlink(missing_ok=True)
+        raise
+    return staged, f"{token}.webp"
+
+
+def finalize_photo(staged: Path, filename: str) -> None:
+    """Downscale a staged upload to MAX_DIMENSION and store it as WebP.
+
+    Raises ValueError if the image can't be fully decoded (e.g. truncated).
+    Blocking and CPU-bound: call it from a sync handler.
+    """
+    from PIL import Image, ImageOps
+
     dest = UPLOAD_DIR / filename
+    partial = dest.with_suffix(".part")
+    try:
+        with Image.open(staged) as img:
+            # Re-encoding drops EXIF, so bake the camera orientation in first.
+            img = ImageOps.exif_transpose(img)
+            img.thumbnail((MAX_DIMENSION, MAX_DIMENSION))
+            if img.mode not in ("RGB", "RGBA"):
+                img = img.convert("RGBA" if img.has_transparency_data else "RGB")
+            img.save(partial, format="WEBP", quality=WEBP_QUALITY, method=4)
+    except (OSError, Image.DecompressionBombError) as e:
+        raise ValueError("Could not read image file") from e
+    else:
+        # Publish atomically so /uploads never serves a half-written file.
+        os.replace(partial, dest)
+    finally:
+        partial.unlink(missing_ok=True)
+        staged.unlink(missing_ok=True)
 
-    content = await file.read()
-    if len(content) > MAX_SIZE_BYTES:
-        raise ValueError("File too large (max 10 MB)")
 
-    dest.write_bytes(content)
+def save_photo(file: UploadFile) -> str:
+    """Save an uploaded photo and return the filename once it is on disk.
+
+    The full decode happens here, in the request, so a bad image surfaces as
+    a form error and the page redirected to can always load the photo.
+    """
+    staged, filename = stage_photo(file)
+    finalize_photo(staged, filename)
     return filename
 
 
+def delete_photo(filename: str) -> None:
+    """Remove a stored photo, e.g. one saved for a form that then failed validation."""
+    (UPLOAD_DIR / filename).unlink(missing_ok=True)
+
+
 def photo_url(filename: Optional[str]) -> Optional[str]:
     if not filename:
         return None
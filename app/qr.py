@@ -1,31 +1,82 @@
 """QR code generation."""
+import hashlib
 import io
-import qrcode
-from qrcode.image.styledpil import StyledPilImage
-from qrcode.image.styles.moduledrawers import RoundedModuleDrawer
+import os
+import secrets
+from functools import lru_cache
+from pathlib import Path
+from typing import Tuple
 
-from app.config import BASE_URL
+from app.config import BASE_URL, QR_CACHE_DIR
+
+# The image encodes BASE_URL, so cached files are tagged with it; changing
+# BASE_URL then just misses the cache instead of serving stale codes.
+_URL_TAG = hashlib.sha1(BASE_URL.encode()).hexdigest()[:8]
 
 
 def item_url(public_id: str) -> str:
     return f"{BASE_URL}/i/{public_id}"
 
 
-def generate_qr_png(public_id: str) -> bytes:
-    """Generate a QR code PNG for the given public_id."""
-    url = item_url(public_id)
+def _cache_path(public_id: str, ext: str) -> Path:
+    return QR_CACHE_DIR / f"{public_id}.{_URL_TAG}.{ext}"
+
+
+@lru_cache(maxsize=2048)
+def cached_qr(public_id: str, ext: str) -> Tuple[bytes, str]:
+    """Return a stored QR image and its ETag.
+
+    Raises FileNotFoundError until write_cached_qr() has stored it; lru_cache
+    doesn't keep exceptions, so misses are never cached.
+    """
+    data = _cache_path(public_id, ext).read_bytes()
+    return data, f'"{hashlib.blake2b(data, digest_size=8).hexdigest()}"'
+
+
+def write_cached_qr(public_id: str, ext: str, data: bytes) -> None:
+    """Store a QR image for cached_qr. Only call it for existing items."""
+    path = _cache_path(public_id, ext)
+    partial = path.with_name(f"{path.name}.{secrets.token_hex(4)}.part")
+    partial.write_bytes(data)
+    os.replace(partial, path)
+
+
+def _make_qr(public_id: str):
+    import qrcode
+
     qr = qrcode.QRCode(
         version=None,  # auto-size
         error_correction=qrcode.constants.ERROR_CORRECT_M,
         box_size=10,
         border=2,
     )
-    qr.add_data(url)
+    qr.add_data(item_url(public_id))
     qr.make(fit=True)
-    img = qr.make_image(
+    return qr
+
+
+def generate_qr_png(public_id: str) -> bytes:
+    """Generate a QR code PNG for the given public_id."""
+    # Imported lazily so workers that never serve a QR image skip loading PIL.
+    from qrcode.image.styledpil import StyledPilImage
+    from qrcode.image.styles.moduledrawers import RoundedModuleDrawer
+
+    img = _make_qr(public_id).make_image(
         image_factory=StyledPilImage,
         module_drawer=RoundedModuleDrawer(),
     )
     buf = io.BytesIO()
     img.save(buf, format="PNG")
     return buf.getvalue()
+
+
+def generate_qr_svg(public_id: str) -> bytes:
+    """Generate a QR code SVG for the given public_id.
+
+    A single path, no PIL: cheaper to build than the PNG and sharp at any
+    print size, which is what labels want.
+    """
+    from qrcode.image.svg import SvgPathImage
+
+    img = _make_qr(public_id).make_image(image_factory=SvgPathImage)
+    return img.to_string()
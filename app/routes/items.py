@@ -1,12 +1,12 @@
-import re
+import threading
 from collections import defaultdict
 from datetime import date, timedelta
 from typing import Optional, List
 
 from fastapi import APIRouter, Depends, Form, Query, Request, UploadFile, File
 from fastapi.responses import HTMLResponse, RedirectResponse, Response
-from sqlalchemy import func
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import event, func, insert, literal, select, update
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
 
 from difflib import SequenceMatcher
 
@@ -24,39 +24,196 @@ def _fuzzy_match(query, choices, cutoff=0.75):
     return (best, best_score) if best else None
 
 from app.config import GOOGLE_CLOUD_API_KEY
-from app.database import get_db
-from app.models import FoodItem, InventoryEntry, ItemRevision, RevisionLink, StorageLocation, Tag
+from app.database import SessionLocal, get_db
+from app.dropdowns import get_all_tags, get_locations
+from app.models import FoodItem, InventoryEntry, ItemRevision, RevisionLink, Tag, item_revisions_fts, item_tags
 from app.ocr import extract_text, get_name_candidates, guess_food_name
-from app.photo import photo_url, save_photo
-from app.qr import generate_qr_png, item_url
+from app.photo import delete_photo, photo_url, save_photo
+from app.qr import cached_qr, generate_qr_png, generate_qr_svg, item_url, write_cached_qr
 from app.templating import templates
 
 router = APIRouter()
 
-URL_RE = re.compile(
-    r"^https?://[^\s/$.?#].[^\s]*$", re.IGNORECASE
-)
 
+def _is_valid_url(url: str) -> bool:
+    """http(s) URL whose host part doesn't start with /$.?# and has no whitespace.
 
-def _get_item_or_404(public_id: str, db: Session) -> FoodItem:
-    item = (
-        db.query(FoodItem)
-        .options(
-            joinedload(FoodItem.revisions)
-            .joinedload(ItemRevision.links),
-            joinedload(FoodItem.revisions)
-            .joinedload(ItemRevision.storage_location),
-            joinedload(FoodItem.tags),
-            joinedload(FoodItem.entries),
+    Plain string checks rather than a regex, so the cost is linear in the
+    URL length whatever the user submits.
+    """
+    scheme = url[:8].lower()
+    if scheme.startswith("https://"):
+        rest = url[8:]
+    elif scheme.startswith("http://"):
+        rest = url[7:]
+    else:
+        return False
+    return len(rest) >= 2 and rest[0] not in "/$.?#" and rest.split() == [rest]
+
+
+LIST_CACHE_MAX = 64
+
+# Rendered item list pages keyed by (q, location, show_deleted, today).
+# Every write goes through a Session commit, which empties it; the generation
+# counter stops a render that raced a commit from storing a stale page. The
+# lock keeps a commit from landing between that check and the store.
+_list_cache = {}
+_list_cache_gen = 0
+_list_cache_lock = threading.Lock()
+
+
+@event.listens_for(SessionLocal, "after_commit")
+def _clear_list_cache(session) -> None:
+    global _list_cache_gen
+    with _list_cache_lock:
+        _list_cache_gen += 1
+        _list_cache.clear()
+
+
+def _store_list_page(cache_key, gen: int, body: bytes) -> None:
+    """Cache a rendered list page unless a commit happened since gen was read."""
+    with _list_cache_lock:
+        if gen != _list_cache_gen:
+            return
+        if len(_list_cache) >= LIST_CACHE_MAX:
+            _list_cache.clear()
+        _list_cache[cache_key] = body
+
+
+def _clean_links(link_urls: List[str], link_labels: List[str]):
+    """Strip and validate posted links. Returns (clean_links, errors)."""
+    clean_links = []
+    errors = []
+    for url, label in zip(link_urls, link_labels):
+        url = url.strip()
+        if not url:
+            continue
+        if _is_valid_url(url):
+            clean_links.append((url, label.strip() or None))
+        else:
+            errors.append(f"Invalid URL: {url}")
+    return clean_links, errors
+
+
+def _name_matches(db: Session, q: str):
+    """Case-insensitive substring filter on revision name."""
+    # On SQLite use the trigram FTS index; trigrams need at least 3 characters.
+    if db.get_bind().dialect.name == "sqlite" and len(q) >= 3:
+        phrase = '"' + q.replace('"', '""') + '"'
+        return ItemRevision.id.in_(
+            select(item_revisions_fts.c.rowid)
+            .where(item_revisions_fts.c.name.op("MATCH")(phrase))
         )
-        .filter(FoodItem.public_id == public_id)
-        .first()
-    )
+    return ItemRevision.name.ilike(f"%{q}%")
+
+
+def _get_item_or_404(
+    public_id: str, db: Session, load_tags: bool = True, load_history: bool = False
+) -> FoodItem:
+    """Load an item with its latest revision, entries and (unless load_tags=False) tags.
+
+    Pages render the latest revision only. Pass load_history=True where
+    latest_active_revision may need to walk back past a deleted revision.
+    Read-only pages that just list tag names skip the tag load and use
+    _get_item_tags instead.
+    """
+    options = [
+        # Many-to-one, so join it and its location into the item query.
+        joinedload(FoodItem.latest_revision).selectinload(ItemRevision.links),
+        joinedload(FoodItem.latest_revision).joinedload(ItemRevision.storage_location),
+        # Sibling collections: separate IN queries, no tags x entries product.
+        selectinload(FoodItem.entries),
+    ]
+    if load_history:
+        options += [
+            selectinload(FoodItem.revisions).selectinload(ItemRevision.links),
+            selectinload(FoodItem.revisions).joinedload(ItemRevision.storage_location),
+        ]
+    if load_tags:
+        options.append(selectinload(FoodItem.tags))
+    # Anything not listed above raises instead of lazy-loading.
+    options.append(raiseload("*"))
+    item = db.scalars(
+        select(FoodItem).options(*options).where(FoodItem.public_id == public_id)
+    ).first()
     if not item:
         raise _not_found()
     return item
 
 
+def _get_item_tags(db: Session, item_id: int):
+    """(id, name) rows for an item's tags, for pages that only display them."""
+    return db.execute(
+        select(Tag.id, Tag.name)
+        .join(item_tags, item_tags.c.tag_id == Tag.id)
+        .where(item_tags.c.item_id == item_id)
+        .order_by(Tag.name)
+    ).all()
+
+
+def _get_item_ref_or_404(public_id: str, db: Session):
+    """(id, current_revision_id, revision_num) for write handlers that don't need the full item."""
+    row = db.execute(
+        select(FoodItem.id, FoodItem.current_revision_id, ItemRevision.revision_num)
+        .outerjoin(ItemRevision, ItemRevision.id == FoodItem.current_revision_id)
+        .where(FoodItem.public_id == public_id)
+    ).first()
+    if row is None:
+        raise _not_found()
+    return row
+
+
+def _set_current_revision(item: FoodItem, revision: ItemRevision) -> None:
+    """Point the item at its newest revision. Call after flushing the revision."""
+    item.current_revision_id = revision.id
+    item.is_current_deleted = revision.is_deleted
+
+
+def _set_current_revision_id(db: Session, item_id: int, revision_id: int, is_deleted: bool) -> None:
+    """_set_current_revision for revisions inserted with Core, without loading the item."""
+    db.execute(
+        update(FoodItem)
+        .where(FoodItem.id == item_id)
+        .values(current_revision_id=revision_id, is_current_deleted=is_deleted)
+    )
+
+
+def _add_links(db: Session, revision_id: int, links) -> None:
+    """Insert (url, label) pairs for a revision in a single executemany."""
+    if links:
+        db.execute(
+            insert(RevisionLink),
+            [{"revision_id": revision_id, "url": url, "label": label} for url, label in links],
+        )
+
+
+def _copy_revision(db: Session, source_id: int, revision_num: int, is_deleted: bool) -> int:
+    """Insert a copy of revision source_id with INSERT ... SELECT; return the new id.
+
+    Expiry and amount are left empty: they live on inventory entries now.
+    created_at comes from the column default.
+    """
+    new_id = db.scalar(
+        insert(ItemRevision)
+        .from_select(
+            ["item_id", "revision_num", "name", "date_prepared", "storage_location_id",
+             "photo_filename", "notes", "is_deleted"],
+            select(
+                ItemRevision.item_id,
+                literal(revision_num),
+                ItemRevision.name,
+                ItemRevision.date_prepared,
+                ItemRevision.storage_location_id,
+                ItemRevision.photo_filename,
+                ItemRevision.notes,
+                literal(is_deleted),
+            ).where(ItemRevision.id == source_id),
+        )
+        .returning(ItemRevision.id)
+    )
+    return new_id
+
+
 def _not_found():
     from fastapi import HTTPException
     return HTTPException(status_code=404, detail="Item not found")
@@ -72,79 +229,102 @@ def item_list(
     show_deleted: bool = Query(False),
     db: Session = Depends(get_db),
 ):
-    locations = db.query(StorageLocation).order_by(StorageLocation.name).all()
-
-    # Subquery: latest revision per item
-    latest_rev_sq = (
-        db.query(
-            ItemRevision.item_id,
-            func.max(ItemRevision.revision_num).label("max_rev"),
+    today_ = date.today()
+    cache_key = (q, location, show_deleted, today_)
+    cached = _list_cache.get(cache_key)
+    if cached is not None:
+        return HTMLResponse(cached)
+    gen = _list_cache_gen
+
+    locations = get_locations(db)
+
+    # The list only renders a handful of columns, so fetch plain rows instead
+    # of ORM objects. Entry counts and the earliest expiry come from one
+    # aggregate over the active entries rather than loading every entry.
+    active = (
+        select(
+            InventoryEntry.item_id,
+            func.count().label("entry_count"),
+            func.min(InventoryEntry.expiration_date).label("earliest_expiry"),
+            # Only shown when there is exactly one active entry.
+            func.max(InventoryEntry.amount).label("amount"),
+            func.max(InventoryEntry.amount_unit).label("amount_unit"),
         )
-        .group_by(ItemRevision.item_id)
+        .where(InventoryEntry.is_consumed == False)  # noqa: E712
+        .group_by(InventoryEntry.item_id)
         .subquery()
     )
-
-    query = (
-        db.query(ItemRevision)
-        .join(
-            latest_rev_sq,
-            (ItemRevision.item_id == latest_rev_sq.c.item_id)
-            & (ItemRevision.revision_num == latest_rev_sq.c.max_rev),
-        )
-        .options(
-            joinedload(ItemRevision.item).joinedload(FoodItem.entries),
-            joinedload(ItemRevision.storage_location),
+    stmt = (
+        select(
+            ItemRevision.item_id,
+            FoodItem.public_id,
+            ItemRevision.name,
+            ItemRevision.notes,
+            ItemRevision.photo_filename,
+            ItemRevision.is_deleted,
+            ItemRevision.storage_location_id,
+            func.coalesce(active.c.entry_count, 0).label("entry_count"),
+            active.c.earliest_expiry,
+            active.c.amount,
+            active.c.amount_unit,
         )
+        .select_from(ItemRevision)
+        .join(FoodItem, FoodItem.current_revision_id == ItemRevision.id)
+        .outerjoin(active, active.c.item_id == ItemRevision.item_id)
     )
 
     if not show_deleted:
-        query = query.filter(ItemRevision.is_deleted == False)  # noqa: E712
+        stmt = stmt.where(ItemRevision.is_deleted == False)  # noqa: E712
     if q:
-        query = query.filter(ItemRevision.name.ilike(f"%{q}%"))
+        stmt = stmt.where(_name_matches(db, q))
     if location:
-        query = query.filter(ItemRevision.storage_location_id == location)
+        stmt = stmt.where(ItemRevision.storage_location_id == location)
 
-    revisions = query.all()
+    revisions = db.execute(stmt).all()
 
-    # Group revisions by location for carousel layout
-    loc_items = {loc.id: [] for loc in locations}
+    # One pass: bucket by location for the carousels, index by item for the
+    # tag sections, and pick out the "Expiring Soon" rows (within 3 days, not
+    # already expired).
+    soon = today_ + timedelta(days=3)
+    loc_items = defaultdict(list)
+    rev_by_item = {}
+    expiring_soon = []
     for rev in revisions:
-        if rev.storage_location_id in loc_items:
-            loc_items[rev.storage_location_id].append(rev)
+        loc_items[rev.storage_location_id].append(rev)
+        rev_by_item[rev.item_id] = rev
+        exp = rev.earliest_expiry
+        if exp and not rev.is_deleted and today_ <= exp <= soon:
+            expiring_soon.append(rev)
 
     sections = []
     for loc in locations:
-        items = loc_items.get(loc.id, [])
+        items = loc_items.get(loc.id)
         if items:
-            items.sort(key=lambda r: r.item.earliest_expiry or date.max)
+            items.sort(key=lambda r: r.earliest_expiry or date.max)
             sections.append({"location": loc, "revisions": items})
 
-    # Build tag sections for default tags
-    default_tags = db.query(Tag).filter(Tag.is_default == True).order_by(Tag.name).all()  # noqa: E712
+    # Build tag sections for default tags from one query over the association
+    # table; tags with no items in our results get no section anyway.
+    tag_rows = db.execute(
+        select(Tag.id, Tag.name, item_tags.c.item_id)
+        .join(item_tags, item_tags.c.tag_id == Tag.id)
+        .where(Tag.is_default == True)  # noqa: E712
+        .order_by(Tag.name)
+    ).all()
+    tags_by_id = {}
+    revs_by_tag = defaultdict(list)
+    for row in tag_rows:
+        rev = rev_by_item.get(row.item_id)
+        if rev is not None:
+            tags_by_id.setdefault(row.id, row)
+            revs_by_tag[row.id].append(rev)
     tag_sections = []
-    # Build a lookup of item_id -> latest revision from our query results
-    rev_by_item = {rev.item_id: rev for rev in revisions}
-    for tag in default_tags:
-        # Get items with this tag that have a latest revision in our results
-        tag_revs = []
-        for item in tag.items:
-            if item.id in rev_by_item:
-                tag_revs.append(rev_by_item[item.id])
-        if tag_revs:
-            tag_revs.sort(key=lambda r: r.item.earliest_expiry or date.max)
-            tag_sections.append({"tag": tag, "revisions": tag_revs})
-
-    # Build "Expiring Soon" section (within 3 days, not already expired)
-    today_ = date.today()
-    soon = today_ + timedelta(days=3)
-    expiring_soon = [
-        rev for rev in revisions
-        if not rev.is_deleted
-        and rev.item.earliest_expiry
-        and today_ <= rev.item.earliest_expiry <= soon
-    ]
+    for tag_id, tag in tags_by_id.items():
+        tag_revs = revs_by_tag[tag_id]
+        tag_revs.sort(key=lambda r: r.earliest_expiry or date.max)
+        tag_sections.append({"tag": tag, "revisions": tag_revs})
 
-    return templates.TemplateResponse(
+    response = templates.TemplateResponse(
         "items/list.html",
         {
             "request": request,
@@ -158,6 +338,8 @@ def item_list(
             "photo_url": photo_url,
         },
     )
+    _store_list_page(cache_key, gen, response.body)
+    return response
 
 
 # --- Create item ---
@@ -168,8 +350,8 @@ def create_form(
     location: Optional[int] = Query(None),
     db: Session = Depends(get_db),
 ):
-    locations = db.query(StorageLocation).order_by(StorageLocation.name).all()
-    all_tags = db.query(Tag).order_by(Tag.name).all()
+    locations = get_locations(db)
+    all_tags = get_all_tags(db)
     return templates.TemplateResponse(
         "items/create.html",
         {
@@ -183,8 +365,10 @@ def create_form(
     )
 
 
+# Handlers that touch the DB or photo files are plain `def`: FastAPI runs them
+# in its threadpool, so the blocking Session/PIL/OCR calls stay off the event loop.
 @router.post("/items")
-async def create_item(
+def create_item(
     request: Request,
     name: str = Form(...),
     date_prepared: date = Form(...),
@@ -207,27 +391,22 @@ async def create_item(
     if exp < date_prepared:
         errors.append("Expiration date must be on or after date prepared.")
 
-    # Validate links
-    clean_links = []
-    for url, label in zip(link_urls, link_labels):
-        url = url.strip()
-        if not url:
-            continue
-        if not URL_RE.match(url):
-            errors.append(f"Invalid URL: {url}")
-        else:
-            clean_links.append((url, label.strip() or None))
+    clean_links, link_errors = _clean_links(link_urls, link_labels)
+    errors.extend(link_errors)
 
     photo_filename = None
+    new_photo = None
     if photo and photo.filename:
         try:
-            photo_filename = await save_photo(photo)
+            photo_filename = new_photo = save_photo(photo)
         except ValueError as e:
             errors.append(str(e))
 
     if errors:
-        locations = db.query(StorageLocation).order_by(StorageLocation.name).all()
-        all_tags = db.query(Tag).order_by(Tag.name).all()
+        if new_photo:
+            delete_photo(new_photo)
+        locations = get_locations(db)
+        all_tags = get_all_tags(db)
         return templates.TemplateResponse(
             "items/create.html",
             {
@@ -250,15 +429,13 @@ async def create_item(
             },
         )
 
-    item = FoodItem()
+    # Associate tags before the first flush; the new item's tag collection
+    # can't be lazy-loaded afterwards.
+    tags = db.scalars(select(Tag).where(Tag.id.in_(tag_ids))).all() if tag_ids else []
+    item = FoodItem(tags=tags)
     db.add(item)
     db.flush()  # get item.id
 
-    # Associate tags
-    if tag_ids:
-        tags = db.query(Tag).filter(Tag.id.in_(tag_ids)).all()
-        item.tags = tags
-
     revision = ItemRevision(
         item_id=item.id,
         revision_num=1,
@@ -273,9 +450,9 @@ async def create_item(
     )
     db.add(revision)
     db.flush()
+    _set_current_revision(item, revision)
 
-    for url, label in clean_links:
-        db.add(RevisionLink(revision_id=revision.id, url=url, label=label))
+    _add_links(db, revision.id, clean_links)
 
     entry = InventoryEntry(
         item_id=item.id,
@@ -294,7 +471,7 @@ async def create_item(
 
 @router.get("/items/bulk", response_class=HTMLResponse)
 def bulk_upload_form(request: Request, db: Session = Depends(get_db)):
-    locations = db.query(StorageLocation).order_by(StorageLocation.name).all()
+    locations = get_locations(db)
     return templates.TemplateResponse(
         "items/bulk_upload.html",
         {
@@ -306,7 +483,7 @@ def bulk_upload_form(request: Request, db: Session = Depends(get_db)):
 
 
 @router.post("/items/bulk", response_class=HTMLResponse)
-async def bulk_upload_process(
+def bulk_upload_process(
     request: Request,
     storage_location_id: int = Form(...),
     photos: List[UploadFile] = File(default=[]),
@@ -334,7 +511,7 @@ async def bulk_upload_process(
         if not photo.filename:
             continue
         try:
-            filename = await save_photo(photo)
+            filename = save_photo(photo)
         except ValueError:
             continue
 
@@ -365,27 +542,14 @@ async def bulk_upload_process(
             item["group_key"] = ""
 
     # Fuzzy-match against existing non-deleted items
-    latest_rev_sq = (
-        db.query(
-            ItemRevision.item_id,
-            func.max(ItemRevision.revision_num).label("max_rev"),
-        )
-        .group_by(ItemRevision.item_id)
-        .subquery()
-    )
-    existing_revs = (
-        db.query(ItemRevision)
-        .join(
-            latest_rev_sq,
-            (ItemRevision.item_id == latest_rev_sq.c.item_id)
-            & (ItemRevision.revision_num == latest_rev_sq.c.max_rev),
-        )
+    existing_revs = db.scalars(
+        select(ItemRevision)
+        .join(FoodItem, FoodItem.current_revision_id == ItemRevision.id)
         .options(
             joinedload(ItemRevision.item).joinedload(FoodItem.entries),
         )
-        .filter(ItemRevision.is_deleted == False)  # noqa: E712
-        .all()
-    )
+        .where(ItemRevision.is_deleted == False)  # noqa: E712
+    ).unique().all()
     existing_choices = {
         rev.name: {
             "public_id": rev.item.public_id,
@@ -404,7 +568,7 @@ async def bulk_upload_process(
                 matched_name = result[0]
                 item["existing_match"] = existing_choices[matched_name]
 
-    locations = db.query(StorageLocation).order_by(StorageLocation.name).all()
+    locations = get_locations(db)
     today_ = date.today()
     return templates.TemplateResponse(
         "items/bulk_review.html",
@@ -419,9 +583,13 @@ async def bulk_upload_process(
     )
 
 
+async def _read_form(request: Request):
+    """Parse the raw form on the event loop so the handler itself can stay sync."""
+    return await request.form()
+
+
 @router.post("/items/bulk/confirm")
-async def bulk_confirm(request: Request, db: Session = Depends(get_db)):
-    form = await request.form()
+def bulk_confirm(request: Request, form=Depends(_read_form), db: Session = Depends(get_db)):
 
     # Parse indexed form fields
     items_data = []
@@ -495,6 +663,8 @@ async def bulk_confirm(request: Request, db: Session = Depends(get_db)):
             amount_unit=None,
         )
         db.add(revision)
+        db.flush()
+        _set_current_revision(food_item, revision)
 
         for item_d in item_data_list:
             idp = _parse_date(item_d["date_prepared"], today_)
@@ -514,11 +684,9 @@ async def bulk_confirm(request: Request, db: Session = Depends(get_db)):
 
     # Add entries to existing items
     for item_d in existing_items:
-        food_item = (
-            db.query(FoodItem)
-            .filter(FoodItem.public_id == item_d["existing_id"])
-            .first()
-        )
+        food_item = db.scalars(
+            select(FoodItem).where(FoodItem.public_id == item_d["existing_id"])
+        ).first()
         if not food_item:
             continue
         idp = _parse_date(item_d["date_prepared"], today_)
@@ -555,27 +723,14 @@ def match_item(q: str = Query(""), db: Session = Depends(get_db)):
     if not q:
         return {"match": None}
 
-    latest_rev_sq = (
-        db.query(
-            ItemRevision.item_id,
-            func.max(ItemRevision.revision_num).label("max_rev"),
-        )
-        .group_by(ItemRevision.item_id)
-        .subquery()
-    )
-    existing_revs = (
-        db.query(ItemRevision)
-        .join(
-            latest_rev_sq,
-            (ItemRevision.item_id == latest_rev_sq.c.item_id)
-            & (ItemRevision.revision_num == latest_rev_sq.c.max_rev),
-        )
+    existing_revs = db.scalars(
+        select(ItemRevision)
+        .join(FoodItem, FoodItem.current_revision_id == ItemRevision.id)
         .options(
             joinedload(ItemRevision.item).joinedload(FoodItem.entries),
         )
-        .filter(ItemRevision.is_deleted == False)  # noqa: E712
-        .all()
-    )
+        .where(ItemRevision.is_deleted == False)  # noqa: E712
+    ).unique().all()
 
     choices = {}
     for rev in existing_revs:
@@ -598,7 +753,7 @@ def match_item(q: str = Query(""), db: Session = Depends(get_db)):
 
 @router.get("/i/{public_id}", response_class=HTMLResponse)
 def item_detail(public_id: str, request: Request, db: Session = Depends(get_db)):
-    item = _get_item_or_404(public_id, db)
+    item = _get_item_or_404(public_id, db, load_tags=False)
     rev = item.latest_revision
     today_ = date.today()
 
@@ -608,6 +763,7 @@ def item_detail(public_id: str, request: Request, db: Session = Depends(get_db))
             "request": request,
             "item": item,
             "rev": rev,
+            "tags": _get_item_tags(db, item.id),
             "is_deleted": item.is_deleted,
             "entries": item.active_entries,
             "consumed_count": len([e for e in item.entries if e.is_consumed]),
@@ -621,18 +777,41 @@ def item_detail(public_id: str, request: Request, db: Session = Depends(get_db))
 
 # --- QR code image ---
 
+# A QR code only encodes the item URL, so it never changes for a public_id.
+QR_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def _qr_response(public_id: str, request: Request, db: Session, render, ext: str, media_type: str):
+    # A stored image means the item exists (items are never hard-deleted), so
+    # repeat requests skip the DB entirely.
+    try:
+        content, etag = cached_qr(public_id, ext)
+    except FileNotFoundError:
+        if db.scalar(select(FoodItem.id).where(FoodItem.public_id == public_id)) is None:
+            raise _not_found()
+        write_cached_qr(public_id, ext, render(public_id))
+        content, etag = cached_qr(public_id, ext)
+    headers = {"Cache-Control": QR_CACHE_CONTROL, "ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=content, media_type=media_type, headers=headers)
+
+
 @router.get("/i/{public_id}/qr.png")
-def qr_image(public_id: str, db: Session = Depends(get_db)):
-    item = _get_item_or_404(public_id, db)
-    png = generate_qr_png(item.public_id)
-    return Response(content=png, media_type="image/png")
+def qr_image(public_id: str, request: Request, db: Session = Depends(get_db)):
+    return _qr_response(public_id, request, db, generate_qr_png, "png", "image/png")
+
+
+@router.get("/i/{public_id}/qr.svg")
+def qr_svg(public_id: str, request: Request, db: Session = Depends(get_db)):
+    return _qr_response(public_id, request, db, generate_qr_svg, "svg", "image/svg+xml")
 
 
 # --- Printable label ---
 
 @router.get("/i/{public_id}/label", response_class=HTMLResponse)
 def printable_label(public_id: str, request: Request, db: Session = Depends(get_db)):
-    item = _get_item_or_404(public_id, db)
+    item = _get_item_or_404(public_id, db, load_tags=False)
     rev = item.latest_revision
 
     return templates.TemplateResponse(
@@ -642,7 +821,7 @@ def printable_label(public_id: str, request: Request, db: Session = Depends(get_
             "item": item,
             "rev": rev,
             "earliest_expiry": item.earliest_expiry,
-            "qr_url": f"/i/{public_id}/qr.png",
+            "qr_url": f"/i/{public_id}/qr.svg",
         },
     )
 
@@ -651,10 +830,10 @@ def printable_label(public_id: str, request: Request, db: Session = Depends(get_
 
 @router.get("/i/{public_id}/edit", response_class=HTMLResponse)
 def edit_form(public_id: str, request: Request, db: Session = Depends(get_db)):
-    item = _get_item_or_404(public_id, db)
+    item = _get_item_or_404(public_id, db, load_history=True)
     rev = item.latest_active_revision or item.latest_revision
-    locations = db.query(StorageLocation).order_by(StorageLocation.name).all()
-    all_tags = db.query(Tag).order_by(Tag.name).all()
+    locations = get_locations(db)
+    all_tags = get_all_tags(db)
     item_tag_ids = {t.id for t in item.tags}
 
     return templates.TemplateResponse(
@@ -672,7 +851,7 @@ def edit_form(public_id: str, request: Request, db: Session = Depends(get_db)):
 
 
 @router.post("/i/{public_id}/edit")
-async def save_edit(
+def save_edit(
     public_id: str,
     request: Request,
     name: str = Form(...),
@@ -692,28 +871,24 @@ async def save_edit(
     if not name.strip():
         errors.append("Name is required.")
 
-    clean_links = []
-    for url, label in zip(link_urls, link_labels):
-        url = url.strip()
-        if not url:
-            continue
-        if not URL_RE.match(url):
-            errors.append(f"Invalid URL: {url}")
-        else:
-            clean_links.append((url, label.strip() or None))
+    clean_links, link_errors = _clean_links(link_urls, link_labels)
+    errors.extend(link_errors)
 
     photo_filename = None
+    new_photo = None
     if photo and photo.filename:
         try:
-            photo_filename = await save_photo(photo)
+            photo_filename = new_photo = save_photo(photo)
         except ValueError as e:
             errors.append(str(e))
     elif keep_photo and prev_rev:
         photo_filename = prev_rev.photo_filename
 
     if errors:
-        locations = db.query(StorageLocation).order_by(StorageLocation.name).all()
-        all_tags = db.query(Tag).order_by(Tag.name).all()
+        if new_photo:
+            delete_photo(new_photo)
+        locations = get_locations(db)
+        all_tags = get_all_tags(db)
         return templates.TemplateResponse(
             "items/edit.html",
             {
@@ -728,11 +903,22 @@ async def save_edit(
             },
         )
 
-    # Update item tags
-    if tag_ids:
-        item.tags = db.query(Tag).filter(Tag.id.in_(tag_ids)).all()
-    else:
-        item.tags = []
+    # Update item tags: write only the association rows that changed, and
+    # ignore ids that aren't real tags.
+    current_tag_ids = {tag.id for tag in item.tags}
+    desired_tag_ids = set(tag_ids) & {tag.id for tag in get_all_tags(db)}
+    removed = current_tag_ids - desired_tag_ids
+    added = desired_tag_ids - current_tag_ids
+    if removed:
+        db.execute(
+            item_tags.delete().where(
+                item_tags.c.item_id == item.id, item_tags.c.tag_id.in_(removed)
+            )
+        )
+    if added:
+        db.execute(
+            item_tags.insert(), [{"item_id": item.id, "tag_id": tag_id} for tag_id in added]
+        )
 
     new_num = (prev_rev.revision_num + 1) if prev_rev else 1
     revision = ItemRevision(
@@ -749,9 +935,9 @@ async def save_edit(
     )
     db.add(revision)
     db.flush()
+    _set_current_revision(item, revision)
 
-    for url, label in clean_links:
-        db.add(RevisionLink(revision_id=revision.id, url=url, label=label))
+    _add_links(db, revision.id, clean_links)
 
     db.commit()
     return RedirectResponse(f"/i/{public_id}", status_code=303)
@@ -768,7 +954,7 @@ def add_entry(
     amount_unit: str = Form(""),
     db: Session = Depends(get_db),
 ):
-    item = _get_item_or_404(public_id, db)
+    item = _get_item_ref_or_404(public_id, db)
     exp = expiration_date or (date_prepared + timedelta(days=7))
     entry = InventoryEntry(
         item_id=item.id,
@@ -789,11 +975,11 @@ def consume_entry(
     db: Session = Depends(get_db),
 ):
     from datetime import datetime, timezone
-    entry = db.query(InventoryEntry).filter(
-        InventoryEntry.id == entry_id,
-        InventoryEntry.item_id == FoodItem.id,
-        FoodItem.public_id == public_id,
-    ).join(FoodItem).first()
+    entry = db.scalars(
+        select(InventoryEntry)
+        .join(FoodItem)
+        .where(InventoryEntry.id == entry_id, FoodItem.public_id == public_id)
+    ).first()
     if not entry:
         raise _not_found()
     entry.is_consumed = True
@@ -807,29 +993,21 @@ def consume_entry(
 @router.post("/i/{public_id}/delete")
 def soft_delete(public_id: str, db: Session = Depends(get_db)):
     from datetime import datetime, timezone
-    item = _get_item_or_404(public_id, db)
-    prev = item.latest_revision
+    item = _get_item_ref_or_404(public_id, db)
+    if item.current_revision_id is None:
+        raise _not_found()
 
-    revision = ItemRevision(
-        item_id=item.id,
-        revision_num=(prev.revision_num + 1) if prev else 1,
-        name=prev.name if prev else "Unknown",
-        date_prepared=prev.date_prepared if prev else date.today(),
-        expiration_date=None,
-        storage_location_id=prev.storage_location_id if prev else 1,
-        photo_filename=prev.photo_filename if prev else None,
-        notes=prev.notes if prev else None,
-        amount=None,
-        amount_unit=None,
-        is_deleted=True,
+    revision_id = _copy_revision(
+        db, item.current_revision_id, item.revision_num + 1, is_deleted=True
     )
-    db.add(revision)
+    _set_current_revision_id(db, item.id, revision_id, is_deleted=True)
 
     # Mark all active entries as consumed
-    now = datetime.now(timezone.utc)
-    for entry in item.active_entries:
-        entry.is_consumed = True
-        entry.consumed_at = now
+    db.execute(
+        update(InventoryEntry)
+        .where(InventoryEntry.item_id == item.id, InventoryEntry.is_consumed == False)  # noqa: E712
+        .values(is_consumed=True, consumed_at=datetime.now(timezone.utc))
+    )
 
     db.commit()
     return RedirectResponse(f"/i/{public_id}", status_code=303)
@@ -839,33 +1017,29 @@ def soft_delete(public_id: str, db: Session = Depends(get_db)):
 
 @router.post("/i/{public_id}/restore")
 def restore_item(public_id: str, db: Session = Depends(get_db)):
-    item = _get_item_or_404(public_id, db)
+    item = _get_item_ref_or_404(public_id, db)
+    if item.current_revision_id is None:
+        raise _not_found()
 
     # Copy fields from last active revision, or from latest if none active
-    source = item.latest_active_revision or item.latest_revision
-    prev = item.latest_revision
+    source_id = db.scalar(
+        select(ItemRevision.id)
+        .where(ItemRevision.item_id == item.id, ItemRevision.is_deleted == False)  # noqa: E712
+        .order_by(ItemRevision.revision_num.desc())
+        .limit(1)
+    ) or item.current_revision_id
 
-    revision = ItemRevision(
-        item_id=item.id,
-        revision_num=(prev.revision_num + 1) if prev else 1,
-        name=source.name,
-        date_prepared=source.date_prepared,
-        expiration_date=None,
-        storage_location_id=source.storage_location_id,
-        photo_filename=source.photo_filename,
-        notes=source.notes,
-        amount=None,
-        amount_unit=None,
-        is_deleted=False,
-    )
-    db.add(revision)
-    db.flush()
+    revision_id = _copy_revision(db, source_id, item.revision_num + 1, is_deleted=False)
+    _set_current_revision_id(db, item.id, revision_id, is_deleted=False)
 
     # Copy links from source revision
-    for link in source.links:
-        db.add(RevisionLink(
-            revision_id=revision.id, url=link.url, label=link.label
-        ))
+    db.execute(
+        insert(RevisionLink).from_select(
+            ["revision_id", "url", "label"],
+            select(literal(revision_id), RevisionLink.url, RevisionLink.label)
+            .where(RevisionLink.revision_id == source_id),
+        )
+    )
 
     db.commit()
     return RedirectResponse(f"/i/{public_id}", status_code=303)
@@ -875,12 +1049,12 @@ def restore_item(public_id: str, db: Session = Depends(get_db)):
 
 @router.get("/i/{public_id}/reuse", response_class=HTMLResponse)
 def reuse_form(public_id: str, request: Request, db: Session = Depends(get_db)):
-    item = _get_item_or_404(public_id, db)
+    item = _get_item_or_404(public_id, db, load_tags=False)
     if not item.is_deleted:
         return RedirectResponse(f"/i/{public_id}", status_code=303)
 
     prev = item.latest_revision
-    locations = db.query(StorageLocation).order_by(StorageLocation.name).all()
+    locations = get_locations(db)
 
     return templates.TemplateResponse(
         "items/reuse.html",
@@ -896,7 +1070,7 @@ def reuse_form(public_id: str, request: Request, db: Session = Depends(get_db)):
 
 
 @router.post("/i/{public_id}/reuse")
-async def reuse_label(
+def reuse_label(
     public_id: str,
     request: Request,
     name: str = Form(...),
@@ -911,7 +1085,7 @@ async def reuse_label(
     photo: Optional[UploadFile] = File(None),
     db: Session = Depends(get_db),
 ):
-    item = _get_item_or_404(public_id, db)
+    item = _get_item_or_404(public_id, db, load_tags=False)
     prev = item.latest_revision
 
     errors = []
@@ -922,25 +1096,21 @@ async def reuse_label(
     if exp < date_prepared:
         errors.append("Expiration date must be on or after date prepared.")
 
-    clean_links = []
-    for url, label in zip(link_urls, link_labels):
-        url = url.strip()
-        if not url:
-            continue
-        if not URL_RE.match(url):
-            errors.append(f"Invalid URL: {url}")
-        else:
-            clean_links.append((url, label.strip() or None))
+    clean_links, link_errors = _clean_links(link_urls, link_labels)
+    errors.extend(link_errors)
 
     photo_filename = None
+    new_photo = None
     if photo and photo.filename:
         try:
-            photo_filename = await save_photo(photo)
+            photo_filename = new_photo = save_photo(photo)
         except ValueError as e:
             errors.append(str(e))
 
     if errors:
-        locations = db.query(StorageLocation).order_by(StorageLocation.name).all()
+        if new_photo:
+            delete_photo(new_photo)
+        locations = get_locations(db)
         return templates.TemplateResponse(
             "items/reuse.html",
             {
@@ -979,9 +1149,9 @@ async def reuse_label(
     )
     db.add(revision)
     db.flush()
+    _set_current_revision(item, revision)
 
-    for url, label in clean_links:
-        db.add(RevisionLink(revision_id=revision.id, url=url, label=label))
+    _add_links(db, revision.id, clean_links)
 
     entry = InventoryEntry(
         item_id=item.id,
@@ -998,16 +1168,50 @@ async def reuse_label(
 
 # --- History ---
 
+HISTORY_PAGE_SIZE = 50
+# Keeps the OFFSET within SQLite's integer range (500k revisions is plenty).
+HISTORY_MAX_PAGE = 10_000
+
 @router.get("/i/{public_id}/history", response_class=HTMLResponse)
-def item_history(public_id: str, request: Request, db: Session = Depends(get_db)):
-    item = _get_item_or_404(public_id, db)
+def item_history(
+    public_id: str,
+    request: Request,
+    page: int = Query(1, ge=1, le=HISTORY_MAX_PAGE),
+    db: Session = Depends(get_db),
+):
+    item = db.scalars(
+        select(FoodItem)
+        .options(joinedload(FoodItem.latest_revision), raiseload("*"))
+        .where(FoodItem.public_id == public_id)
+    ).first()
+    if not item:
+        raise _not_found()
+
+    # Newest first, one page at a time; fetch one extra row to know whether
+    # there is an older page.
+    revisions = db.scalars(
+        select(ItemRevision)
+        .options(
+            selectinload(ItemRevision.links),
+            joinedload(ItemRevision.storage_location),
+            raiseload("*"),
+        )
+        .where(ItemRevision.item_id == item.id)
+        .order_by(ItemRevision.revision_num.desc())
+        .limit(HISTORY_PAGE_SIZE + 1)
+        .offset((page - 1) * HISTORY_PAGE_SIZE)
+    ).all()
+    has_older = len(revisions) > HISTORY_PAGE_SIZE
 
     return templates.TemplateResponse(
         "items/history.html",
         {
             "request": request,
             "item": item,
-            "revisions": list(reversed(item.revisions)),
+            "latest": item.latest_revision,
+            "revisions": revisions[:HISTORY_PAGE_SIZE],
+            "page": page,
+            "has_older": has_older,
             "photo_url": photo_url,
         },
     )
@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends, Form, Request
 from fastapi.responses import HTMLResponse, RedirectResponse
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.database import get_db
+from app.dropdowns import get_locations
 from app.models import StorageLocation
 from app.templating import templates
 
@@ -11,7 +13,7 @@ router = APIRouter()
 
 @router.get("/locations", response_class=HTMLResponse)
 def locations_list(request: Request, db: Session = Depends(get_db)):
-    locations = db.query(StorageLocation).order_by(StorageLocation.name).all()
+    locations = db.scalars(select(StorageLocation).order_by(StorageLocation.name)).all()
     return templates.TemplateResponse(
         "locations/list.html",
         {"request": request, "locations": locations},
@@ -26,15 +28,15 @@ def create_location(
 ):
     name = name.strip()
     if not name:
-        locations = db.query(StorageLocation).order_by(StorageLocation.name).all()
+        locations = db.scalars(select(StorageLocation).order_by(StorageLocation.name)).all()
         return templates.TemplateResponse(
             "locations/list.html",
             {"request": request, "locations": locations, "error": "Name is required."},
         )
 
-    existing = db.query(StorageLocation).filter(StorageLocation.name == name).first()
+    existing = db.scalars(select(StorageLocation).where(StorageLocation.name == name)).first()
     if existing:
-        locations = db.query(StorageLocation).order_by(StorageLocation.name).all()
+        locations = db.scalars(select(StorageLocation).order_by(StorageLocation.name)).all()
         return templates.TemplateResponse(
             "locations/list.html",
             {"request": request, "locations": locations, "error": f"'{name}' already exists."},
@@ -42,4 +44,5 @@ def create_location(
 
     db.add(StorageLocation(name=name))
     db.commit()
+    get_locations.cache_clear()
     return RedirectResponse("/locations", status_code=303)
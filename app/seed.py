@@ -1,5 +1,14 @@
-"""Seed default storage locations and tags."""
+"""Create the schema and seed default storage locations and tags.
+
+Run once per deploy (fly-entrypoint.sh) or before a local run:
+
+    python -m app.seed
+"""
+from sqlalchemy import insert, select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
+
+from app.database import Base, SessionLocal, engine
 from app.models import StorageLocation, Tag
 
 
@@ -11,17 +20,42 @@ DEFAULT_TAGS = [
 ]
 
 
-def seed_locations(db: Session) -> None:
-    existing = {loc.name for loc in db.query(StorageLocation).all()}
-    for name in DEFAULT_LOCATIONS:
-        if name not in existing:
-            db.add(StorageLocation(name=name))
+def _insert_ignoring_duplicates(db: Session, model, rows) -> None:
+    """One multi-row INSERT that skips rows whose unique name already exists."""
+    dialect = db.get_bind().dialect.name
+    if dialect == "sqlite":
+        stmt = sqlite.insert(model).on_conflict_do_nothing(index_elements=["name"])
+    elif dialect == "postgresql":
+        stmt = postgresql.insert(model).on_conflict_do_nothing(index_elements=["name"])
+    else:
+        existing = set(db.scalars(select(model.name)))
+        rows = [row for row in rows if row["name"] not in existing]
+        if not rows:
+            return
+        stmt = insert(model)
+    db.execute(stmt.values(rows))
     db.commit()
 
 
+def seed_locations(db: Session) -> None:
+    # Runs on every start: defaults added later reach existing databases, and
+    # ones already present are skipped by the conflict clause.
+    _insert_ignoring_duplicates(db, StorageLocation, [{"name": name} for name in DEFAULT_LOCATIONS])
+
+
 def seed_tags(db: Session) -> None:
-    existing = {t.name for t in db.query(Tag).all()}
-    for tag_def in DEFAULT_TAGS:
-        if tag_def["name"] not in existing:
-            db.add(Tag(name=tag_def["name"], is_default=tag_def["is_default"]))
-    db.commit()
+    _insert_ignoring_duplicates(db, Tag, DEFAULT_TAGS)
+
+
+def init_db() -> None:
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        seed_locations(db)
+        seed_tags(db)
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    init_db()
@@ -1,4 +1,8 @@
 from fastapi.templating import Jinja2Templates
-from app.config import BASE_DIR
+from jinja2 import FileSystemBytecodeCache
+
+from app.config import BASE_DIR, JINJA_CACHE_DIR, TEMPLATES_AUTO_RELOAD
 
 templates = Jinja2Templates(directory=str(BASE_DIR / "app" / "templates"))
+templates.env.auto_reload = TEMPLATES_AUTO_RELOAD
+templates.env.bytecode_cache = FileSystemBytecodeCache(str(JINJA_CACHE_DIR))
@@ -98,6 +98,113 @@ if os.path.exists(db_path):
     conn.close()
 "
 
+# Add the current-revision pointer to food_items and backfill it
+python -c "
+import sqlite3, os
+db_path = '/data/food_storage.db'
+if os.path.exists(db_path):
+    conn = sqlite3.connect(db_path)
+    cols = [r[1] for r in conn.execute('PRAGMA table_info(food_items)')]
+    if 'current_revision_id' not in cols:
+        conn.execute('ALTER TABLE food_items ADD COLUMN current_revision_id INTEGER REFERENCES item_revisions(id)')
+        # One window pass over item_revisions instead of a lookup per item
+        conn.execute('''
+            WITH ranked AS (
+                SELECT id, item_id, ROW_NUMBER() OVER (
+                    PARTITION BY item_id ORDER BY revision_num DESC
+                ) AS rn
+                FROM item_revisions
+            )
+            UPDATE food_items SET current_revision_id = ranked.id
+            FROM ranked
+            WHERE ranked.item_id = food_items.id
+              AND ranked.rn = 1
+        ''')
+    conn.commit()
+    conn.close()
+"
+
+# Denormalize the current revision's deleted flag onto food_items
+python -c "
+import sqlite3, os
+db_path = '/data/food_storage.db'
+if os.path.exists(db_path):
+    conn = sqlite3.connect(db_path)
+    cols = [r[1] for r in conn.execute('PRAGMA table_info(food_items)')]
+    if 'is_current_deleted' not in cols:
+        conn.execute('ALTER TABLE food_items ADD COLUMN is_current_deleted BOOLEAN NOT NULL DEFAULT 0')
+        conn.execute('''
+            UPDATE food_items SET is_current_deleted = COALESCE((
+                SELECT is_deleted FROM item_revisions
+                WHERE id = food_items.current_revision_id
+            ), 0)
+        ''')
+    conn.commit()
+    conn.close()
+"
+
+# Indexes added after the initial schema
+python -c "
+import sqlite3, os
+db_path = '/data/food_storage.db'
+if os.path.exists(db_path):
+    conn = sqlite3.connect(db_path)
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS ix_revisions_item_revnum
+        ON item_revisions(item_id, revision_num)
+    ''')
+    # Covered by ix_revisions_item_revnum's leading column
+    conn.execute('DROP INDEX IF EXISTS ix_item_revisions_item_id')
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS ix_revisions_loc_deleted
+        ON item_revisions(storage_location_id, is_deleted)
+    ''')
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS ix_food_items_current_revision_id
+        ON food_items(current_revision_id)
+    ''')
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS ix_entries_active_item_exp
+        ON inventory_entries(item_id, expiration_date)
+        WHERE is_consumed = 0
+    ''')
+    conn.commit()
+    conn.close()
+"
+
+# Trigram full-text index for name search (mirrors _FTS_DDL in app/models.py)
+python -c "
+import sqlite3, os
+db_path = '/data/food_storage.db'
+if os.path.exists(db_path):
+    conn = sqlite3.connect(db_path)
+    exists = conn.execute(
+        \"SELECT 1 FROM sqlite_master WHERE name = 'item_revisions_fts'\"
+    ).fetchone()
+    if not exists:
+        conn.executescript('''
+            CREATE VIRTUAL TABLE item_revisions_fts USING fts5(
+                name, content='item_revisions', content_rowid='id', tokenize='trigram'
+            );
+            CREATE TRIGGER IF NOT EXISTS item_revisions_fts_ai AFTER INSERT ON item_revisions BEGIN
+                INSERT INTO item_revisions_fts(rowid, name) VALUES (new.id, new.name);
+            END;
+            CREATE TRIGGER IF NOT EXISTS item_revisions_fts_ad AFTER DELETE ON item_revisions BEGIN
+                INSERT INTO item_revisions_fts(item_revisions_fts, rowid, name) VALUES ('delete', old.id, old.name);
+            END;
+            CREATE TRIGGER IF NOT EXISTS item_revisions_fts_au AFTER UPDATE OF name ON item_revisions BEGIN
+                INSERT INTO item_revisions_fts(item_revisions_fts, rowid, name) VALUES ('delete', old.id, old.name);
+                INSERT INTO item_revisions_fts(rowid, name) VALUES (new.id, new.name);
+            END;
+            INSERT INTO item_revisions_fts(item_revisions_fts) VALUES ('rebuild');
+        ''')
+    conn.commit()
+    conn.close()
+"
+
+# Create any missing tables and seed defaults (once per deploy, not per worker)
+python -m app.seed
+
 # Run with uvicorn directly (saves ~40MB vs gunicorn master+worker)
 exec uvicorn app.main:app \
     --host 0.0.0.0 \
@@ -2,5 +2,8 @@
 """Run the QR Food Storage app."""
 import uvicorn
 
+from app.seed import init_db
+
 if __name__ == "__main__":
+    init_db()
     uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
@@ -0,0 +1,45 @@
+"""Shared fixtures: an app client on a throwaway SQLite file and a query counter."""
+import os
+import shutil
+import tempfile
+
+# app.config reads these at import time, so set them before any app import.
+_TMP_DIR = tempfile.mkdtemp(prefix="qr-food-storage-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_TMP_DIR}/test.db"
+os.environ["UPLOAD_DIR"] = os.path.join(_TMP_DIR, "uploads")
+os.environ["QR_CACHE_DIR"] = os.path.join(_TMP_DIR, "qr_cache")
+os.environ["JINJA_CACHE_DIR"] = os.path.join(_TMP_DIR, "jinja_cache")
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.database import engine
+from app.main import app
+from app.seed import init_db
+
+
+@pytest.fixture(scope="session")
+def client():
+    init_db()
+    with TestClient(app) as c:
+        yield c
+    engine.dispose()
+    shutil.rmtree(_TMP_DIR, ignore_errors=True)
+
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, *args):
+        self.count += 1
+
+
+@pytest.fixture
+def count_queries():
+    """Count SQL statements run on the engine while the test body executes."""
+    counter = QueryCounter()
+    event.listen(engine, "before_cursor_execute", counter)
+    yield counter
+    event.remove(engine, "before_cursor_execute", counter)
@@ -0,0 +1,104 @@
+"""Render every item page through the full stack.
+
+Relationships are lazy="raise_on_sql" and page queries end in raiseload("*"),
+so a missing eager load surfaces here as a 500 rather than in production.
+The query ceilings catch loaders that regress to a query per row.
+"""
+import io
+
+import pytest
+from PIL import Image
+
+
+def _png_bytes() -> bytes:
+    buf = io.BytesIO()
+    Image.new("RGB", (64, 48), "red").save(buf, format="PNG")
+    return buf.getvalue()
+
+
+def _create_item(client, name: str, with_photo: bool = False) -> str:
+    response = client.post(
+        "/items",
+        data={
+            "name": name,
+            "date_prepared": "2026-01-15",
+            "storage_location_id": "1",
+            "link_urls": ["https://example.com/recipe"],
+            "link_labels": ["Recipe"],
+            "tag_ids": ["1"],
+            "amount": "2",
+            "amount_unit": "cups",
+        },
+        files={"photo": ("photo.png", _png_bytes(), "image/png")} if with_photo else None,
+        follow_redirects=False,
+    )
+    assert response.status_code == 303, response.text
+    return response.headers["location"].rsplit("/", 1)[-1]
+
+
+@pytest.fixture(scope="module")
+def items(client):
+    """One edited item with a photo, one deleted then restored, one left deleted."""
+    edited = _create_item(client, "Chicken soup", with_photo=True)
+    response = client.post(
+        f"/i/{edited}/edit",
+        data={
+            "name": "Chicken soup v2",
+            "storage_location_id": "2",
+            "link_urls": ["https://example.com/v2"],
+            "link_labels": [""],
+            "tag_ids": ["2"],
+            "keep_photo": "true",
+        },
+        follow_redirects=False,
+    )
+    assert response.status_code == 303, response.text
+
+    restored = _create_item(client, "Bean chili")
+    assert client.post(f"/i/{restored}/delete", follow_redirects=False).status_code == 303
+    assert client.post(f"/i/{restored}/restore", follow_redirects=False).status_code == 303
+
+    deleted = _create_item(client, "Old stew")
+    assert client.post(f"/i/{deleted}/delete", follow_redirects=False).status_code == 303
+
+    return {"edited": edited, "restored": restored, "deleted": deleted}
+
+
+PAGES = [
+    # (path template, max queries)
+    ("/", 4),
+    ("/?show_deleted=true", 4),
+    ("/i/{edited}", 5),
+    ("/i/{restored}", 5),
+    ("/i/{deleted}", 5),
+    ("/i/{edited}/edit", 7),
+    ("/i/{deleted}/edit", 7),
+    ("/i/{edited}/label", 4),
+    ("/i/{edited}/history", 4),
+    ("/i/{edited}/reuse", 8),
+    ("/i/{deleted}/reuse", 8),
+    ("/i/{edited}/qr.png", 1),
+    ("/i/{edited}/qr.svg", 1),
+]
+
+
+@pytest.mark.parametrize("path,max_queries", PAGES)
+def test_page_renders_within_query_budget(client, items, count_queries, path, max_queries):
+    response = client.get(path.format(**items))
+    assert response.status_code == 200, response.text
+    assert count_queries.count <= max_queries
+
+
+def test_pages_show_current_state(client, items):
+    listing = client.get("/").text
+    assert "Chicken soup v2" in listing
+    assert "Bean chili" in listing
+    assert "Old stew" not in listing
+    assert "Old stew" in client.get("/?show_deleted=true").text
+
+    detail = client.get(f"/i/{items['edited']}").text
+    assert "https://example.com/v2" in detail
+    assert "has been deleted" in client.get(f"/i/{items['deleted']}").text
+
+    history = client.get(f"/i/{items['edited']}/history").text
+    assert "Revision #2" in history and "Revision #1" in history